@@ -7,12 +7,16 @@ orchestrating the UI components and business logic.
 
 import streamlit as st
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
-from mortgage_calculator.calculations import MortgageCalculator
-from mortgage_calculator.models import MortgageInputs
+from mortgage_calculator.calculations import calculate_all
+from mortgage_calculator.models import (
+    MortgageInputs,
+    MortgageResults,
+    PaymentSchedule,
+)
 from mortgage_calculator.ui_components import MortgageUI
-from mortgage_calculator.utils import validate_inputs
+from mortgage_calculator.utils import VALIDATION_MESSAGES, validate_inputs_code
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +26,38 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@st.cache_data(max_entries=32)
+def calculate_mortgage_cached(
+    home_value: float,
+    deposit: float,
+    interest_rate: float,
+    loan_term_years: int,
+) -> Tuple[MortgageResults, PaymentSchedule]:
+    """
+    Calculate mortgage results and schedule, memoized across reruns.
+    
+    Streamlit reruns the whole script on every widget interaction, so the
+    calculation is cached on the scalar inputs and only recomputed when
+    one of them actually changes.
+    
+    Args:
+        home_value: The total value of the home
+        deposit: The initial deposit amount
+        interest_rate: Annual interest rate as a percentage
+        loan_term_years: The loan term in years
+        
+    Returns:
+        Tuple of (MortgageResults, PaymentSchedule)
+    """
+    inputs = MortgageInputs(
+        home_value=home_value,
+        deposit=deposit,
+        interest_rate=interest_rate,
+        loan_term_years=loan_term_years,
+    )
+    return calculate_all(inputs)
+
+
 def main() -> None:
     """
     Main application function.
@@ -52,27 +88,32 @@ def main() -> None:
         inputs = ui.render_input_section()
         
         # Validate inputs
-        validation_error = validate_inputs(
+        validation_code = validate_inputs_code(
             inputs.home_value,
             inputs.deposit,
             inputs.interest_rate,
             inputs.loan_term_years,
         )
         
-        if validation_error:
+        if validation_code:
+            validation_error = VALIDATION_MESSAGES[validation_code - 1]
             ui.show_error(validation_error)
             logger.warning(f"Validation error: {validation_error}")
             return
         
         # Perform calculations
         logger.info(f"Calculating mortgage for inputs: {inputs}")
-        calculator = MortgageCalculator()
-        results, schedule = calculator.calculate_all(inputs)
+        results, schedule = calculate_mortgage_cached(
+            inputs.home_value,
+            inputs.deposit,
+            inputs.interest_rate,
+            inputs.loan_term_years,
+        )
         
         # Display results
         ui.render_summary_metrics(results)
         ui.render_additional_info(inputs, results)
-        ui.render_payment_schedule(schedule)
+        ui.render_payment_schedule(schedule, results)
         
         logger.info("Calculations completed successfully")
         
@@ -0,0 +1,25 @@
+"""
+Ahead-of-time build of the iterative schedule kernel.
+
+Compiles ``calculations._schedule_kernel`` with Numba's AOT compiler into
+a ``mortgage_kernels`` extension module next to this file, so the
+application can load native code without any JIT compilation at start-up.
+
+Usage:
+    python -m mortgage_calculator._build_aot
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .calculations import _schedule_kernel
+
+cc = CC("mortgage_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export("schedule_f64", "f8[:,:](f8, f8, f8, i8)")(_schedule_kernel)
+
+
+if __name__ == "__main__":
+    cc.compile()
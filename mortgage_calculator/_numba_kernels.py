@@ -0,0 +1,87 @@
+"""
+Numba-compiled batch kernels for the utility functions.
+
+This module requires Numba and is only imported lazily by ``utils``,
+which falls back to equivalent NumPy implementations without it.
+"""
+
+import numpy as np
+from numba import cfunc, njit, prange, types
+
+from .utils import _failed_validation_rules
+
+# The shared scalar rules, compiled so the batch kernel applies exactly
+# the same checks as utils.validate_inputs_code
+_failed_rules = njit(_failed_validation_rules)
+
+
+@cfunc(types.float64(types.float64, types.float64), cache=True)
+def ltv_cfunc(home_value: float, deposit: float) -> float:
+    """
+    Native ``double(double, double)`` version of the LTV ratio.
+    
+    Callable from other Numba-compiled code or through its C address
+    without any Python-level call overhead.
+    
+    Args:
+        home_value: The home value
+        deposit: The deposit amount
+    
+    Returns:
+        LTV ratio as a percentage
+    """
+    if home_value <= 0.0:
+        return 0.0
+    return (home_value - deposit) / home_value * 100.0
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def ltv_batch(home_values: np.ndarray, deposits: np.ndarray) -> np.ndarray:
+    """
+    Calculate loan-to-value ratios for many scenarios in parallel.
+    
+    Args:
+        home_values: 1-D array of home values
+        deposits: 1-D array of deposit amounts
+    
+    Returns:
+        1-D array of LTV ratios as percentages
+    """
+    out = np.empty(home_values.shape[0])
+    for i in prange(home_values.shape[0]):
+        if home_values[i] <= 0.0:
+            out[i] = 0.0
+        else:
+            out[i] = (home_values[i] - deposits[i]) / home_values[i] * 100.0
+    return out
+
+
+@njit(parallel=True, cache=True)
+def validate_batch(
+    home_values: np.ndarray,
+    deposits: np.ndarray,
+    interest_rates: np.ndarray,
+    loan_terms: np.ndarray,
+) -> np.ndarray:
+    """
+    Validate many sets of inputs in parallel.
+    
+    Args:
+        home_values: 1-D array of home values
+        deposits: 1-D array of deposit amounts
+        interest_rates: 1-D array of annual interest rate percentages
+        loan_terms: 1-D array of loan terms in years
+    
+    Returns:
+        1-D int8 array of utils.validate_inputs_code results
+    """
+    out = np.zeros(home_values.shape[0], dtype=np.int8)
+    for i in prange(home_values.shape[0]):
+        failed = _failed_rules(
+            home_values[i], deposits[i], interest_rates[i], loan_terms[i]
+        )
+        for rule in range(len(failed)):
+            if failed[rule]:
+                out[i] = rule + 1
+                break
+    return out
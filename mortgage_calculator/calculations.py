@@ -5,146 +5,374 @@ This module contains the core business logic for calculating mortgage
 payments, interest, and payment schedules.
 """
 
+import functools
 import math
-from typing import List
+from typing import Callable, Tuple, Union
+
+import numpy as np
 
 from .config import MONTHS_PER_YEAR, PERCENTAGE_DIVISOR
 from .models import (
+    MortgageBatchResults,
     MortgageInputs,
     MortgageResults,
     PaymentSchedule,
-    PaymentScheduleEntry,
+    validate_input_arrays,
 )
 
+ArrayLike = Union[float, np.ndarray]
 
-class MortgageCalculator:
+
+def _schedule_kernel(
+    loan_amount: float,
+    monthly_rate: float,
+    monthly_payment: float,
+    number_of_payments: int,
+) -> np.ndarray:
     """
-    Calculator for mortgage-related computations.
+    Run the month-by-month amortization recurrence.
     
-    This class provides methods to calculate monthly payments, total interest,
-    and generate payment schedules for a given mortgage.
+    Written in a Numba-compatible subset of Python so the same loop can be
+    JIT-compiled when Numba is installed, or compiled ahead of time by
+    ``mortgage_calculator._build_aot``.
+    
+    Args:
+        loan_amount: Principal loan amount
+        monthly_rate: Monthly interest rate (as decimal)
+        monthly_payment: Fixed monthly payment amount
+        number_of_payments: Total number of monthly payments
+        
+    Returns:
+        Array of shape (4, number_of_payments) whose rows are the payment,
+        principal, interest and remaining balance for each month
     """
+    schedule = np.empty((4, number_of_payments))
+    remaining_balance = loan_amount
     
-    @staticmethod
-    def calculate_mortgage(inputs: MortgageInputs) -> MortgageResults:
-        """
-        Calculate mortgage payment details.
+    for month in range(number_of_payments):
+        # Calculate interest for current month
+        interest_payment = remaining_balance * monthly_rate
         
-        Args:
-            inputs: MortgageInputs object containing loan parameters
-            
-        Returns:
-            MortgageResults object containing calculated values
-            
-        Raises:
-            ValueError: If loan amount is zero or negative
-            ZeroDivisionError: If calculation results in division by zero
-        """
-        loan_amount = inputs.home_value - inputs.deposit
+        # Calculate principal payment (remainder after interest)
+        principal_payment = monthly_payment - interest_payment
         
-        if loan_amount <= 0:
-            raise ValueError(
-                "Loan amount must be positive. "
-                "Ensure home value is greater than deposit."
-            )
+        # Update remaining balance
+        remaining_balance -= principal_payment
         
-        # Convert annual interest rate to monthly decimal rate
-        monthly_interest_rate = (
-            inputs.interest_rate / PERCENTAGE_DIVISOR
-        ) / MONTHS_PER_YEAR
+        # Prevent negative balance due to floating point precision
+        if remaining_balance < 0.01:
+            remaining_balance = 0.0
         
-        number_of_payments = inputs.loan_term_years * MONTHS_PER_YEAR
+        schedule[0, month] = monthly_payment
+        schedule[1, month] = principal_payment
+        schedule[2, month] = interest_payment
+        schedule[3, month] = remaining_balance
+    
+    return schedule
+
+
+@functools.lru_cache(maxsize=None)
+def _get_schedule_kernel() -> Callable[[float, float, float, int], np.ndarray]:
+    """
+    Return the fastest available build of the iterative schedule kernel.
+    
+    In order of preference:
+    1. The ahead-of-time compiled ``mortgage_kernels`` extension, built
+       with ``python -m mortgage_calculator._build_aot``. Loading it costs
+       no compilation at all.
+    2. A Numba JIT build. Numba is imported on first use rather than at
+       module import so the application start-up does not pay for it,
+       and compiled code is cached on disk.
+    3. The pure Python kernel.
+    
+    Returns:
+        Callable with the same signature as _schedule_kernel
+    """
+    try:
+        # Only exists once built, so it is unknown to type checkers
+        from .mortgage_kernels import schedule_f64  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        return schedule_f64
+    
+    try:
+        import numba
+    except ImportError:
+        return _schedule_kernel
+    
+    return numba.njit(cache=True, fastmath=True)(_schedule_kernel)
+
+
+@functools.lru_cache(maxsize=4096)
+def _payment_factor(monthly_interest_rate: float, number_of_payments: int) -> float:
+    """
+    Monthly payment per unit of principal, r(1+r)^n / [(1+r)^n - 1].
+    
+    Depends only on the rate and term, so it is cached: repeated
+    calculations with the same rate and term (e.g. while only the home
+    value or deposit changes) skip the transcendental evaluation.
+    
+    Args:
+        monthly_interest_rate: Monthly interest rate (as decimal)
+        number_of_payments: Total number of monthly payments
         
-        # Calculate monthly payment using standard mortgage formula
-        # M = P * [r(1+r)^n] / [(1+r)^n - 1]
-        # where M = monthly payment, P = principal, r = monthly rate, n = number of payments
-        try:
-            if monthly_interest_rate == 0:
-                # Special case: 0% interest rate
-                monthly_payment = loan_amount / number_of_payments
-            else:
-                power_term = (1 + monthly_interest_rate) ** number_of_payments
-                monthly_payment = (
-                    loan_amount
-                    * (monthly_interest_rate * power_term)
-                    / (power_term - 1)
-                )
-        except ZeroDivisionError as e:
-            raise ZeroDivisionError(
-                "Error in payment calculation. Check input values."
-            ) from e
+    Returns:
+        Payment factor to multiply the loan amount by
+    """
+    if monthly_interest_rate == 0:
+        # Special case: 0% interest rate
+        return 1 / number_of_payments
+    
+    # (1+r)^n - 1 evaluated as expm1(n * log1p(r)) so that it stays
+    # accurate for small rates instead of cancelling against 1
+    power_term_minus_one = math.expm1(
+        number_of_payments * math.log1p(monthly_interest_rate)
+    )
+    return (
+        monthly_interest_rate * (1 + power_term_minus_one) / power_term_minus_one
+    )
+
+
+def calculate_mortgage(inputs: MortgageInputs) -> MortgageResults:
+    """
+    Calculate mortgage payment details.
+    
+    Args:
+        inputs: MortgageInputs object containing loan parameters
         
-        total_payments = monthly_payment * number_of_payments
-        total_interest = total_payments - loan_amount
+    Returns:
+        MortgageResults object containing calculated values
         
-        return MortgageResults(
-            loan_amount=loan_amount,
-            monthly_payment=monthly_payment,
-            total_payments=total_payments,
-            total_interest=total_interest,
-            monthly_interest_rate=monthly_interest_rate,
-            number_of_payments=number_of_payments,
+    Raises:
+        ValueError: If loan amount is zero or negative
+        ZeroDivisionError: If calculation results in division by zero
+    """
+    loan_amount = inputs.home_value - inputs.deposit
+    
+    if loan_amount <= 0:
+        raise ValueError(
+            "Loan amount must be positive. "
+            "Ensure home value is greater than deposit."
         )
     
-    @staticmethod
-    def generate_payment_schedule(
-        inputs: MortgageInputs,
-        results: MortgageResults,
-    ) -> PaymentSchedule:
-        """
-        Generate a detailed payment schedule for the mortgage.
+    # Convert annual interest rate to monthly decimal rate
+    monthly_interest_rate = (
+        inputs.interest_rate / PERCENTAGE_DIVISOR
+    ) / MONTHS_PER_YEAR
+    
+    number_of_payments = inputs.loan_term_years * MONTHS_PER_YEAR
+    
+    # Calculate monthly payment using standard mortgage formula
+    # M = P * [r(1+r)^n] / [(1+r)^n - 1]
+    # where M = monthly payment, P = principal, r = monthly rate, n = number of payments
+    try:
+        monthly_payment = loan_amount * _payment_factor(
+            monthly_interest_rate, number_of_payments
+        )
+    except ZeroDivisionError as e:
+        raise ZeroDivisionError(
+            "Error in payment calculation. Check input values."
+        ) from e
+    
+    total_payments = monthly_payment * number_of_payments
+    total_interest = total_payments - loan_amount
+    
+    return MortgageResults(
+        loan_amount=loan_amount,
+        monthly_payment=monthly_payment,
+        total_payments=total_payments,
+        total_interest=total_interest,
+        monthly_interest_rate=monthly_interest_rate,
+        number_of_payments=number_of_payments,
+    )
+
+
+def calculate_mortgage_batch(
+    home_values: ArrayLike,
+    deposits: ArrayLike,
+    interest_rates: ArrayLike,
+    loan_term_years: ArrayLike,
+) -> MortgageBatchResults:
+    """
+    Calculate mortgage payment details for many scenarios at once.
+    
+    Inputs are broadcast against each other, so e.g. a whole range of
+    interest rates can be evaluated for a single home value and deposit.
+    
+    Args:
+        home_values: Home values
+        deposits: Deposit amounts
+        interest_rates: Annual interest rates as percentages
+        loan_term_years: Loan terms in years
         
-        Args:
-            inputs: MortgageInputs object containing loan parameters
-            results: MortgageResults object from calculate_mortgage
-            
-        Returns:
-            PaymentSchedule object containing all payment entries
-        """
-        entries: List[PaymentScheduleEntry] = []
-        remaining_balance = results.loan_amount
+    Returns:
+        MortgageBatchResults object with one element per scenario
         
-        for month in range(1, results.number_of_payments + 1):
-            # Calculate interest for current month
-            interest_payment = remaining_balance * results.monthly_interest_rate
-            
-            # Calculate principal payment (remainder after interest)
-            principal_payment = results.monthly_payment - interest_payment
-            
-            # Update remaining balance
-            remaining_balance -= principal_payment
-            
-            # Prevent negative balance due to floating point precision
-            if remaining_balance < 0.01:
-                remaining_balance = 0
-            
-            # Calculate which year of the loan this payment is in
-            year = math.ceil(month / MONTHS_PER_YEAR)
-            
-            entries.append(
-                PaymentScheduleEntry(
-                    month=month,
-                    payment=results.monthly_payment,
-                    principal=principal_payment,
-                    interest=interest_payment,
-                    remaining_balance=remaining_balance,
-                    year=year,
-                )
+    Raises:
+        ValueError: If any scenario fails the MortgageInputs checks, or if
+            any loan amount is zero or negative
+    """
+    home_values, deposits, interest_rates, loan_term_years = np.broadcast_arrays(
+        np.asarray(home_values, dtype=np.float64),
+        np.asarray(deposits, dtype=np.float64),
+        np.asarray(interest_rates, dtype=np.float64),
+        np.asarray(loan_term_years, dtype=np.int64),
+    )
+    validate_input_arrays(home_values, deposits, interest_rates, loan_term_years)
+    
+    loan_amounts = home_values - deposits
+    
+    if np.any(loan_amounts <= 0):
+        raise ValueError(
+            "Loan amount must be positive. "
+            "Ensure home value is greater than deposit."
+        )
+    
+    # Convert annual interest rates to monthly decimal rates
+    monthly_interest_rates = (
+        interest_rates / PERCENTAGE_DIVISOR
+    ) / MONTHS_PER_YEAR
+    
+    number_of_payments = loan_term_years * MONTHS_PER_YEAR
+    
+    # Same formula as calculate_mortgage, evaluated for every scenario:
+    # M = P * [r(1+r)^n] / [(1+r)^n - 1]
+    power_term_minus_one = np.expm1(
+        number_of_payments * np.log1p(monthly_interest_rates)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        monthly_payments = np.where(
+            monthly_interest_rates == 0,
+            # Special case: 0% interest rate
+            loan_amounts / number_of_payments,
+            loan_amounts
+            * (monthly_interest_rates * (1 + power_term_minus_one))
+            / power_term_minus_one,
+        )
+    
+    total_payments = monthly_payments * number_of_payments
+    total_interest = total_payments - loan_amounts
+    
+    return MortgageBatchResults(
+        loan_amount=loan_amounts,
+        monthly_payment=monthly_payments,
+        total_payments=total_payments,
+        total_interest=total_interest,
+        monthly_interest_rate=monthly_interest_rates,
+        number_of_payments=number_of_payments,
+    )
+
+
+def generate_payment_schedule(
+    inputs: MortgageInputs,
+    results: MortgageResults,
+    iterative: bool = False,
+) -> PaymentSchedule:
+    """
+    Generate a detailed payment schedule for the mortgage.
+    
+    By default the schedule is computed in closed form with NumPy.
+    Passing ``iterative=True`` runs the month-by-month recurrence
+    instead, compiled with Numba when it is installed.
+    
+    Args:
+        inputs: MortgageInputs object containing loan parameters
+        results: MortgageResults object from calculate_mortgage
+        iterative: Whether to use the iterative recurrence
+        
+    Returns:
+        PaymentSchedule object containing all payment columns
+    """
+    loan_amount = results.loan_amount
+    monthly_rate = results.monthly_interest_rate
+    monthly_payment = results.monthly_payment
+    
+    # Month and year numbers never exceed a few hundred, so 32-bit integers
+    # halve their footprint. Amounts stay float64: float32 cannot hold
+    # cent precision on balances of this size.
+    months = np.arange(1, results.number_of_payments + 1, dtype=np.int32)
+    
+    # Calculate which year of the loan each payment is in
+    years = (months - 1) // MONTHS_PER_YEAR + 1
+    
+    if iterative:
+        schedule_kernel = _get_schedule_kernel()
+        payments, principal_payments, interest_payments, balances = (
+            schedule_kernel(
+                float(loan_amount),
+                float(monthly_rate),
+                float(monthly_payment),
+                int(results.number_of_payments),
             )
+        )
+    else:
+        # Closed-form balance after k payments:
+        # B_k = P(1+r)^k - M[(1+r)^k - 1] / r = P + (P - M/r)[(1+r)^k - 1]
+        # Each step below writes into a preallocated buffer, so no
+        # intermediate arrays are created along the way
+        balances = months.astype(np.float64)
+        if monthly_rate == 0:
+            # Special case: 0% interest rate, B_k = P - M*k
+            np.multiply(balances, -monthly_payment, out=balances)
+        else:
+            # (1+r)^k - 1 for every month from a single log1p evaluation
+            np.multiply(balances, math.log1p(monthly_rate), out=balances)
+            np.expm1(balances, out=balances)
+            np.multiply(
+                balances,
+                loan_amount - monthly_payment / monthly_rate,
+                out=balances,
+            )
+        np.add(balances, loan_amount, out=balances)
+        
+        # Interest accrues on the balance carried over from the previous month
+        interest_payments = np.empty_like(balances)
+        interest_payments[0] = loan_amount * monthly_rate
+        np.multiply(balances[:-1], monthly_rate, out=interest_payments[1:])
         
-        return PaymentSchedule(entries=entries)
+        # Principal payment is the remainder after interest
+        principal_payments = np.subtract(monthly_payment, interest_payments)
+        
+        # Prevent negative balance due to floating point precision
+        balances[balances < 0.01] = 0.0
+        payments = np.full_like(balances, monthly_payment)
+    
+    return PaymentSchedule(
+        month=months,
+        payment=payments,
+        principal=principal_payments,
+        interest=interest_payments,
+        remaining_balance=balances,
+        year=years,
+    )
+
+
+def calculate_all(inputs: MortgageInputs) -> Tuple[MortgageResults, PaymentSchedule]:
+    """
+    Convenience function to calculate both results and schedule.
     
-    @classmethod
-    def calculate_all(cls, inputs: MortgageInputs) -> tuple[MortgageResults, PaymentSchedule]:
-        """
-        Convenience method to calculate both results and schedule.
+    Args:
+        inputs: MortgageInputs object containing loan parameters
         
-        Args:
-            inputs: MortgageInputs object containing loan parameters
-            
-        Returns:
-            Tuple of (MortgageResults, PaymentSchedule)
-        """
-        results = cls.calculate_mortgage(inputs)
-        schedule = cls.generate_payment_schedule(inputs, results)
-        return results, schedule
+    Returns:
+        Tuple of (MortgageResults, PaymentSchedule)
+    """
+    results = calculate_mortgage(inputs)
+    schedule = generate_payment_schedule(inputs, results)
+    return results, schedule
+
+
+class MortgageCalculator:
+    """
+    Backwards-compatible namespace for the calculation functions.
+    
+    The calculations are plain module-level functions; this class only
+    re-exposes them so existing ``MortgageCalculator().calculate_all(...)``
+    callers keep working.
+    """
+    
+    calculate_mortgage = staticmethod(calculate_mortgage)
+    calculate_mortgage_batch = staticmethod(calculate_mortgage_batch)
+    generate_payment_schedule = staticmethod(generate_payment_schedule)
+    calculate_all = staticmethod(calculate_all)
@@ -6,7 +6,73 @@ using dataclasses for type safety and immutability.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+# Input validation messages keyed by their bit in _input_error_mask,
+# in the order the checks are reported
+_INPUT_ERROR_MESSAGES = {
+    1: "Home value must be non-negative",
+    2: "Deposit must be non-negative",
+    4: "Deposit cannot exceed home value",
+    8: "Interest rate must be non-negative",
+    16: "Loan term must be at least 1 year",
+}
+
+
+def _input_error_mask(
+    home_value: Union[float, np.ndarray],
+    deposit: Union[float, np.ndarray],
+    interest_rate: Union[float, np.ndarray],
+    loan_term_years: Union[int, np.ndarray],
+) -> Union[int, np.ndarray]:
+    """
+    Combine all input checks into a single bitmask.
+    
+    Works on scalars and, elementwise, on NumPy arrays.
+    
+    Returns:
+        Bitmask with one bit set per failed check, 0 if all checks pass
+    """
+    return (
+        (home_value < 0)
+        | ((deposit < 0) << 1)
+        | ((deposit > home_value) << 2)
+        | ((interest_rate < 0) << 3)
+        | ((loan_term_years < 1) << 4)
+    )
+
+
+def validate_input_arrays(
+    home_values: np.ndarray,
+    deposits: np.ndarray,
+    interest_rates: np.ndarray,
+    loan_term_years: np.ndarray,
+) -> None:
+    """
+    Apply the MortgageInputs checks to arrays of scenarios at once.
+    
+    Args:
+        home_values: Home values
+        deposits: Deposit amounts
+        interest_rates: Annual interest rates as percentages
+        loan_term_years: Loan terms in years
+        
+    Raises:
+        ValueError: With the same message MortgageInputs would raise for
+            the first failed check across all scenarios
+    """
+    error_mask = int(
+        np.bitwise_or.reduce(
+            _input_error_mask(home_values, deposits, interest_rates, loan_term_years),
+            axis=None,
+        )
+    )
+    if error_mask:
+        raise ValueError(_INPUT_ERROR_MESSAGES[error_mask & -error_mask])
 
 
 @dataclass(frozen=True)
@@ -27,16 +93,18 @@ class MortgageInputs:
     
     def __post_init__(self) -> None:
         """Validate inputs after initialization."""
-        if self.home_value < 0:
-            raise ValueError("Home value must be non-negative")
-        if self.deposit < 0:
-            raise ValueError("Deposit must be non-negative")
-        if self.deposit > self.home_value:
-            raise ValueError("Deposit cannot exceed home value")
-        if self.interest_rate < 0:
-            raise ValueError("Interest rate must be non-negative")
-        if self.loan_term_years < 1:
-            raise ValueError("Loan term must be at least 1 year")
+        # Scalar inputs give a scalar mask; int() narrows it for the lookup
+        error_mask = int(
+            _input_error_mask(
+                self.home_value,
+                self.deposit,
+                self.interest_rate,
+                self.loan_term_years,
+            )
+        )
+        if error_mask:
+            # Report the first failed check (lowest set bit)
+            raise ValueError(_INPUT_ERROR_MESSAGES[error_mask & -error_mask])
 
 
 @dataclass(frozen=True)
@@ -60,6 +128,51 @@ class MortgageResults:
     number_of_payments: int
 
 
+@dataclass(frozen=True, eq=False)
+class MortgageBatchResults:
+    """
+    Immutable data class representing results for many mortgage scenarios.
+    
+    Mirrors MortgageResults, but every attribute is a NumPy array with one
+    element per scenario, shaped like the broadcast inputs.
+    
+    Attributes:
+        loan_amount: Principal loan amounts
+        monthly_payment: Monthly payment amounts
+        total_payments: Total amounts paid over each loan term
+        total_interest: Total interest paid over each loan term
+        monthly_interest_rate: Monthly interest rates (as decimal)
+        number_of_payments: Total numbers of monthly payments
+    """
+    loan_amount: np.ndarray
+    monthly_payment: np.ndarray
+    total_payments: np.ndarray
+    total_interest: np.ndarray
+    monthly_interest_rate: np.ndarray
+    number_of_payments: np.ndarray
+
+
+def _min_by_year(
+    years: np.ndarray,
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Take the minimum of values over each run of equal, sorted years.
+    
+    Args:
+        years: Year of each value, in non-decreasing order
+        values: Values to reduce
+        
+    Returns:
+        Tuple of (distinct years, minimum value in each year)
+    """
+    if len(years) == 0:
+        return years[:0], values[:0]
+    
+    year_starts = np.r_[0, np.flatnonzero(np.diff(years)) + 1]
+    return years[year_starts], np.minimum.reduceat(values, year_starts)
+
+
 @dataclass(frozen=True)
 class PaymentScheduleEntry:
     """
@@ -73,6 +186,16 @@ class PaymentScheduleEntry:
         remaining_balance: Remaining loan balance after payment
         year: Year of the loan (1-indexed)
     """
+    # Declared by hand because dataclass(slots=True) needs Python 3.10+
+    __slots__ = (
+        "month",
+        "payment",
+        "principal",
+        "interest",
+        "remaining_balance",
+        "year",
+    )
+    
     month: int
     payment: float
     principal: float
@@ -81,31 +204,89 @@ class PaymentScheduleEntry:
     year: int
 
 
-@dataclass
+@dataclass(eq=False)
 class PaymentSchedule:
     """
     Data class representing the complete payment schedule.
     
+    The schedule is stored column-wise: every attribute is a NumPy array
+    holding one element per monthly payment.
+    
     Attributes:
-        entries: List of payment schedule entries
+        month: Payment month numbers (1-indexed)
+        payment: Total payment amount for each month
+        principal: Principal portion of each payment
+        interest: Interest portion of each payment
+        remaining_balance: Remaining loan balance after each payment
+        year: Year of the loan for each payment (1-indexed)
     """
-    entries: List[PaymentScheduleEntry]
+    month: np.ndarray
+    payment: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    remaining_balance: np.ndarray
+    year: np.ndarray
+    
+    def __len__(self) -> int:
+        """Return the number of payments in the schedule."""
+        return len(self.month)
+    
+    def __getitem__(self, index: int) -> PaymentScheduleEntry:
+        """
+        Materialize a single payment as a PaymentScheduleEntry.
+        
+        Args:
+            index: Position of the payment in the schedule
+            
+        Returns:
+            PaymentScheduleEntry for the requested payment
+        """
+        return PaymentScheduleEntry(
+            month=int(self.month[index]),
+            payment=float(self.payment[index]),
+            principal=float(self.principal[index]),
+            interest=float(self.interest[index]),
+            remaining_balance=float(self.remaining_balance[index]),
+            year=int(self.year[index]),
+        )
     
-    def to_dict_list(self) -> List[dict]:
+    def min_balance_by_year(self) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Convert payment schedule to a list of dictionaries.
+        Compute the minimum remaining balance for each loan year.
+        
+        Reduces the balance array directly, without building a DataFrame.
+        Payments are stored in month order, so each year is a contiguous
+        run and its minimum comes from one vectorized reduction.
+        
+        Returns:
+            Tuple of (years, minimum remaining balance in each year)
+        """
+        return _min_by_year(self.year, self.remaining_balance)
+    
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Return the schedule columns keyed by their display names.
+        
+        Returns:
+            Dictionary mapping column names to the schedule arrays
+        """
+        return {
+            "Month": self.month,
+            "Payment": self.payment,
+            "Principal": self.principal,
+            "Interest": self.interest,
+            "Remaining Balance": self.remaining_balance,
+            "Year": self.year,
+        }
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert payment schedule to a pandas DataFrame.
+        
+        The columns wrap the schedule arrays directly rather than being
+        copied into a consolidated block.
         
         Returns:
-            List of dictionaries suitable for DataFrame creation
+            DataFrame with one row per payment
         """
-        return [
-            {
-                "Month": entry.month,
-                "Payment": entry.payment,
-                "Principal": entry.principal,
-                "Interest": entry.interest,
-                "Remaining Balance": entry.remaining_balance,
-                "Year": entry.year,
-            }
-            for entry in self.entries
-        ]
+        return pd.DataFrame(self.to_columns(), copy=False)
@@ -7,20 +7,52 @@ and data models.
 
 import pytest
 import math
+import numpy as np
+import pandas as pd
 from mortgage_calculator.models import (
     MortgageInputs,
     MortgageResults,
     PaymentScheduleEntry,
     PaymentSchedule,
 )
-from mortgage_calculator.calculations import MortgageCalculator
+from mortgage_calculator import utils
+from mortgage_calculator.calculations import (
+    MortgageCalculator,
+    _payment_factor,
+    _schedule_kernel,
+)
+from mortgage_calculator.ui_components import (
+    _FLOAT32_CHART_LIMIT,
+    _build_schedule_frames,
+)
 from mortgage_calculator.utils import (
+    aggregate_by_year,
+    create_schedule_dataframe,
     format_currency,
+    format_currency_series,
+    format_monthly_payment,
+    format_total_amount,
+    loan_to_value_ratio_cfunc,
+    ltv_batch,
+    VALIDATION_MESSAGES,
+    validate_batch,
     validate_inputs,
+    validate_inputs_code,
     calculate_loan_to_value_ratio,
 )
 
 
+@pytest.fixture(params=["numpy", "numba"])
+def batch_backend(request, monkeypatch):
+    """Run a batch utility test against each of its implementations."""
+    if request.param == "numpy":
+        monkeypatch.setattr(utils, "_load_numba_kernels", lambda: None)
+    else:
+        pytest.importorskip("numba")
+        assert utils._load_numba_kernels() is not None
+    return request.param
+
+
 class TestMortgageInputs:
     """Tests for MortgageInputs data class."""
     
@@ -86,6 +118,16 @@ class TestMortgageInputs:
                 interest_rate=5.0,
                 loan_term_years=0,
             )
+    
+    def test_first_failed_check_is_reported(self):
+        """Test that the earliest failing check wins when several fail."""
+        with pytest.raises(ValueError, match="Deposit must be non-negative"):
+            MortgageInputs(
+                home_value=500000,
+                deposit=-10000,
+                interest_rate=-1.0,
+                loan_term_years=0,
+            )
 
 
 class TestMortgageCalculator:
@@ -137,6 +179,47 @@ class TestMortgageCalculator:
         # Total interest should be 0
         assert math.isclose(results.total_interest, 0, abs_tol=0.01)
     
+    def test_near_zero_interest_rate(self):
+        """Test that a tiny interest rate converges to the 0% payment."""
+        inputs = MortgageInputs(
+            home_value=500000,
+            deposit=0,
+            interest_rate=1e-9,
+            loan_term_years=30,
+        )
+        
+        calculator = MortgageCalculator()
+        results = calculator.calculate_mortgage(inputs)
+        
+        expected_monthly = 500000 / (30 * 12)
+        assert math.isclose(results.monthly_payment, expected_monthly, rel_tol=1e-9)
+        assert 0 <= results.total_interest < 0.01
+    
+    def test_payment_factor_reused_across_loan_amounts(self):
+        """Test that the rate/term factor is cached independently of price."""
+        calculator = MortgageCalculator()
+        calculator.calculate_mortgage(
+            MortgageInputs(
+                home_value=500000,
+                deposit=100000,
+                interest_rate=6.25,
+                loan_term_years=30,
+            )
+        )
+        hits_before = _payment_factor.cache_info().hits
+        
+        results = calculator.calculate_mortgage(
+            MortgageInputs(
+                home_value=650000,
+                deposit=100000,
+                interest_rate=6.25,
+                loan_term_years=30,
+            )
+        )
+        
+        assert _payment_factor.cache_info().hits == hits_before + 1
+        assert results.loan_amount == 550000
+    
     def test_invalid_loan_amount(self):
         """Test that deposit >= home value raises ValueError."""
         inputs = MortgageInputs(
@@ -164,7 +247,7 @@ class TestMortgageCalculator:
         schedule = calculator.generate_payment_schedule(inputs, results)
         
         # Should have 240 entries (20 years * 12 months)
-        assert len(schedule.entries) == 240
+        assert len(schedule) == 240
     
     def test_payment_schedule_final_balance(self):
         """Test that final payment brings balance to zero."""
@@ -180,8 +263,7 @@ class TestMortgageCalculator:
         schedule = calculator.generate_payment_schedule(inputs, results)
         
         # Final balance should be approximately zero
-        final_entry = schedule.entries[-1]
-        assert final_entry.remaining_balance < 1.0  # Less than $1
+        assert schedule.remaining_balance[-1] < 1.0  # Less than $1
     
     def test_payment_schedule_decreasing_balance(self):
         """Test that remaining balance decreases with each payment."""
@@ -197,10 +279,160 @@ class TestMortgageCalculator:
         schedule = calculator.generate_payment_schedule(inputs, results)
         
         # Check that balance decreases
-        for i in range(len(schedule.entries) - 1):
-            current_balance = schedule.entries[i].remaining_balance
-            next_balance = schedule.entries[i + 1].remaining_balance
+        for i in range(len(schedule) - 1):
+            current_balance = schedule.remaining_balance[i]
+            next_balance = schedule.remaining_balance[i + 1]
             assert current_balance >= next_balance
+    
+    def test_payment_schedule_years(self):
+        """Test that each block of 12 payments maps to one loan year."""
+        inputs = MortgageInputs(
+            home_value=300000,
+            deposit=60000,
+            interest_rate=3.5,
+            loan_term_years=15,
+        )
+        
+        calculator = MortgageCalculator()
+        results = calculator.calculate_mortgage(inputs)
+        schedule = calculator.generate_payment_schedule(inputs, results)
+        
+        assert schedule[0].year == 1
+        assert schedule[11].year == 1
+        assert schedule[12].year == 2
+        assert schedule[-1].year == 15
+    
+    def test_payment_schedule_dtypes(self):
+        """Test that amounts are float64 and month/year columns are int32."""
+        inputs = MortgageInputs(
+            home_value=500000,
+            deposit=100000,
+            interest_rate=5.5,
+            loan_term_years=30,
+        )
+        
+        calculator = MortgageCalculator()
+        schedule = calculator.calculate_all(inputs)[1]
+        
+        assert schedule.month.dtype == np.int32
+        assert schedule.year.dtype == np.int32
+        assert schedule.remaining_balance.dtype == np.float64
+        assert schedule.interest.dtype == np.float64
+    
+    def test_iterative_schedule_matches_closed_form(self):
+        """Test that the iterative and closed-form schedules agree."""
+        inputs = MortgageInputs(
+            home_value=500000,
+            deposit=100000,
+            interest_rate=5.5,
+            loan_term_years=30,
+        )
+        
+        calculator = MortgageCalculator()
+        results = calculator.calculate_mortgage(inputs)
+        closed_form = calculator.generate_payment_schedule(inputs, results)
+        iterative = calculator.generate_payment_schedule(
+            inputs, results, iterative=True
+        )
+        
+        assert len(iterative) == len(closed_form)
+        np.testing.assert_array_equal(iterative.month, closed_form.month)
+        np.testing.assert_array_equal(iterative.year, closed_form.year)
+        np.testing.assert_allclose(
+            iterative.remaining_balance, closed_form.remaining_balance, atol=0.01
+        )
+        np.testing.assert_allclose(
+            iterative.interest, closed_form.interest, atol=0.01
+        )
+    
+    def test_python_schedule_kernel_matches_closed_form(self):
+        """Test the pure Python kernel, whichever kernel is installed."""
+        inputs = MortgageInputs(
+            home_value=500000,
+            deposit=100000,
+            interest_rate=5.5,
+            loan_term_years=30,
+        )
+        
+        calculator = MortgageCalculator()
+        results = calculator.calculate_mortgage(inputs)
+        closed_form = calculator.generate_payment_schedule(inputs, results)
+        payment, principal, interest, remaining_balance = _schedule_kernel(
+            results.loan_amount,
+            results.monthly_interest_rate,
+            results.monthly_payment,
+            results.number_of_payments,
+        )
+        
+        np.testing.assert_allclose(payment, closed_form.payment, atol=0.01)
+        np.testing.assert_allclose(principal, closed_form.principal, atol=0.01)
+        np.testing.assert_allclose(interest, closed_form.interest, atol=0.01)
+        np.testing.assert_allclose(
+            remaining_balance, closed_form.remaining_balance, atol=0.01
+        )
+    
+    def test_batch_matches_scalar_calculation(self):
+        """Test that batch results match one-at-a-time calculations."""
+        home_values = np.array([500000, 300000, 400000])
+        deposits = np.array([100000, 50000, 80000])
+        interest_rates = np.array([5.5, 0.0, 4.0])
+        loan_terms = np.array([30, 25, 20])
+        
+        calculator = MortgageCalculator()
+        batch = calculator.calculate_mortgage_batch(
+            home_values, deposits, interest_rates, loan_terms
+        )
+        
+        for i in range(len(home_values)):
+            results = calculator.calculate_mortgage(
+                MortgageInputs(
+                    home_value=home_values[i],
+                    deposit=deposits[i],
+                    interest_rate=interest_rates[i],
+                    loan_term_years=int(loan_terms[i]),
+                )
+            )
+            assert math.isclose(
+                batch.monthly_payment[i], results.monthly_payment, rel_tol=1e-12
+            )
+            assert math.isclose(
+                batch.total_interest[i], results.total_interest, abs_tol=1e-6
+            )
+            assert batch.number_of_payments[i] == results.number_of_payments
+    
+    def test_batch_broadcasts_scalars(self):
+        """Test sweeping interest rates against a single loan."""
+        interest_rates = np.linspace(0.0, 10.0, 11)
+        
+        calculator = MortgageCalculator()
+        batch = calculator.calculate_mortgage_batch(
+            500000, 100000, interest_rates, 30
+        )
+        
+        assert batch.monthly_payment.shape == interest_rates.shape
+        assert np.all(np.diff(batch.monthly_payment) > 0)
+    
+    def test_batch_invalid_loan_amount(self):
+        """Test that any non-positive loan amount raises ValueError."""
+        calculator = MortgageCalculator()
+        with pytest.raises(ValueError, match="Loan amount must be positive"):
+            calculator.calculate_mortgage_batch(
+                np.array([500000, 200000]),
+                np.array([100000, 200000]),
+                5.0,
+                30,
+            )
+    
+    def test_batch_invalid_inputs(self):
+        """Test that batch inputs go through the MortgageInputs checks."""
+        calculator = MortgageCalculator()
+        with pytest.raises(ValueError, match="Interest rate must be non-negative"):
+            calculator.calculate_mortgage_batch(
+                500000,
+                100000,
+                np.array([5.0, -1.0]),
+                30,
+            )
 
 
 class TestUtilityFunctions:
@@ -216,6 +448,52 @@ class TestUtilityFunctions:
         result = format_currency(1234.56, decimal_places=2)
         assert result == "$1,234.56"
     
+    def test_format_monthly_payment(self):
+        """Test monthly payment formatting."""
+        assert format_monthly_payment(2271.156) == "$2,271.16"
+        assert format_monthly_payment(0.5) == "$0.50"
+    
+    def test_format_total_amount(self):
+        """Test total amount formatting."""
+        assert format_total_amount(817616.16) == "$817,616"
+        assert format_total_amount(999.5) == "$1,000"
+    
+    def test_format_total_amount_rounding(self):
+        """Test that totals round half to even like the float formatter."""
+        for amount in (0.5, 1.5, 2.5, -2.5, 1234567.5, -98765.4321):
+            assert format_total_amount(amount) == format_currency(amount, 0)
+        # Tiny negative totals (e.g. float noise at 0% interest) show as $0
+        assert format_total_amount(-1e-9) == "$0"
+    
+    def test_format_currency_series_matches_scalar(self):
+        """Test that column formatting matches per-value formatting."""
+        amounts = pd.Series([0.0, 1234.56, 99.5, 1234567.891, -42.125])
+        
+        for decimal_places in (0, 2):
+            result = format_currency_series(amounts, decimal_places)
+            expected = [format_currency(a, decimal_places) for a in amounts]
+            assert result.tolist() == expected
+    
+    def test_create_schedule_dataframe_formatted(self):
+        """Test that formatted schedules render currency columns as strings."""
+        schedule = PaymentSchedule(
+            month=np.array([1, 2]),
+            payment=np.array([2271.156, 2271.156]),
+            principal=np.array([437.8227, 439.8294]),
+            interest=np.array([1833.3333, 1831.3266]),
+            remaining_balance=np.array([399562.18, 399122.35]),
+            year=np.array([1, 1]),
+        )
+        
+        df = create_schedule_dataframe(schedule, formatted=True)
+        
+        assert df["Month"].tolist() == [1, 2]
+        assert df["Payment"].tolist() == ["$2,271.16", "$2,271.16"]
+        assert df["Principal"].tolist() == ["$437.82", "$439.83"]
+        assert df["Interest"].tolist() == ["$1,833.33", "$1,831.33"]
+        assert df["Remaining Balance"].tolist() == ["$399,562", "$399,122"]
+        assert df["Year"].tolist() == [1, 1]
+    
     def test_validate_inputs_valid(self):
         """Test validation with valid inputs."""
         error = validate_inputs(500000, 100000, 5.5, 30)
@@ -239,6 +517,22 @@ class TestUtilityFunctions:
         assert error is not None
         assert "Deposit must be less than home value" in error
     
+    def test_validate_inputs_loan_term_bounds(self):
+        """Test validation of the loan term limits."""
+        assert "at least 1 year" in validate_inputs(500000, 100000, 5.0, 0)
+        assert "cannot exceed 50 years" in validate_inputs(500000, 100000, 5.0, 51)
+        assert validate_inputs(500000, 100000, 5.0, 50) is None
+    
+    def test_validate_inputs_code(self):
+        """Test that result codes index the matching messages."""
+        assert validate_inputs_code(500000, 100000, 5.5, 30) == 0
+        
+        code = validate_inputs_code(500000, -10000, 5.0, 30)
+        assert code == 2
+        assert VALIDATION_MESSAGES[code - 1] == validate_inputs(
+            500000, -10000, 5.0, 30
+        )
+    
     def test_calculate_ltv_ratio(self):
         """Test LTV ratio calculation."""
         ltv = calculate_loan_to_value_ratio(500000, 100000)
@@ -248,33 +542,279 @@ class TestUtilityFunctions:
         """Test LTV ratio with zero home value."""
         ltv = calculate_loan_to_value_ratio(0, 0)
         assert ltv == 0.0
+    
+    def test_aggregate_by_year_matches_groupby(self):
+        """Test yearly aggregation against a pandas groupby minimum."""
+        inputs = MortgageInputs(
+            home_value=500000,
+            deposit=100000,
+            interest_rate=5.5,
+            loan_term_years=30,
+        )
+        schedule = MortgageCalculator().calculate_all(inputs)[1]
+        df = create_schedule_dataframe(schedule)
+        
+        result = aggregate_by_year(df)
+        expected = df[["Year", "Remaining Balance"]].groupby("Year").min()
+        
+        assert result.index.name == "Year"
+        np.testing.assert_array_equal(result.index, expected.index)
+        np.testing.assert_array_equal(
+            result["Remaining Balance"], expected["Remaining Balance"]
+        )
+    
+    def test_aggregate_by_year_partial_year(self):
+        """Test yearly aggregation when the last year is incomplete."""
+        df = pd.DataFrame(
+            {
+                "Year": [1, 1, 1, 2, 2],
+                "Remaining Balance": [500.0, 400.0, 300.0, 200.0, 0.0],
+            }
+        )
+        
+        result = aggregate_by_year(df)
+        
+        assert result.index.tolist() == [1, 2]
+        assert result["Remaining Balance"].tolist() == [300.0, 0.0]
+    
+    def test_aggregate_by_year_unsorted_balance(self):
+        """Test that the yearly minimum does not rely on a falling balance."""
+        df = pd.DataFrame(
+            {
+                "Year": [1, 1, 1, 2, 2],
+                "Remaining Balance": [500.0, 300.0, 400.0, 100.0, 200.0],
+            }
+        )
+        
+        result = aggregate_by_year(df)
+        
+        assert result["Remaining Balance"].tolist() == [300.0, 100.0]
+    
+    def test_aggregate_by_year_unsorted_years(self):
+        """Test yearly aggregation when rows are not ordered by year."""
+        df = pd.DataFrame(
+            {
+                "Year": [2, 1, 2, 1],
+                "Remaining Balance": [200.0, 400.0, 100.0, 300.0],
+            }
+        )
+        
+        result = aggregate_by_year(df)
+        
+        assert result.index.name == "Year"
+        assert result.index.tolist() == [1, 2]
+        assert result["Remaining Balance"].tolist() == [300.0, 100.0]
+    
+    def test_aggregate_by_year_empty(self):
+        """Test yearly aggregation of an empty schedule."""
+        df = pd.DataFrame(columns=["Month", "Year", "Remaining Balance"])
+        
+        result = aggregate_by_year(df)
+        
+        assert result.empty
+        assert list(result.columns) == ["Year", "Remaining Balance"]
+        
+        # Callers get their own frame, not the shared module-level one
+        result["Extra"] = []
+        assert list(aggregate_by_year(df).columns) == ["Year", "Remaining Balance"]
+    
+    def test_aggregate_by_year_from_schedule(self):
+        """Test yearly aggregation straight from a PaymentSchedule."""
+        inputs = MortgageInputs(
+            home_value=500000,
+            deposit=100000,
+            interest_rate=5.5,
+            loan_term_years=15,
+        )
+        schedule = MortgageCalculator().calculate_all(inputs)[1]
+        
+        years, min_balances = schedule.min_balance_by_year()
+        result = aggregate_by_year(schedule)
+        expected = aggregate_by_year(create_schedule_dataframe(schedule))
+        
+        assert years.tolist() == list(range(1, 16))
+        np.testing.assert_array_equal(min_balances, schedule.remaining_balance[11::12])
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_ltv_batch_matches_scalar(self, batch_backend):
+        """Test batch LTV ratios against the scalar function."""
+        home_values = np.array([500000.0, 300000.0, 0.0, 250000.0])
+        deposits = np.array([100000.0, 300000.0, 0.0, 12500.0])
+        
+        result = ltv_batch(home_values, deposits)
+        
+        expected = [
+            calculate_loan_to_value_ratio(hv, dep)
+            for hv, dep in zip(home_values, deposits)
+        ]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+    
+    def test_ltv_batch_scalar_and_empty(self, batch_backend):
+        """Test batch LTV ratios for 0-d and empty inputs."""
+        result = ltv_batch(500000.0, 100000.0)
+        empty = ltv_batch(np.array([]), np.array([]))
+        
+        assert result.shape == ()
+        assert math.isclose(float(result), 80.0, rel_tol=1e-12)
+        assert empty.shape == (0,)
+    
+    def test_loan_to_value_ratio_cfunc(self):
+        """Test the native LTV function against the Python one."""
+        pytest.importorskip("numba")
+        ltv_native = loan_to_value_ratio_cfunc().ctypes
+        
+        for home_value, deposit in [(500000, 100000), (0, 0), (250000, 12500)]:
+            assert math.isclose(
+                ltv_native(home_value, deposit),
+                calculate_loan_to_value_ratio(home_value, deposit),
+                rel_tol=1e-12,
+            )
+    
+    def test_validate_batch_codes(self, batch_backend):
+        """Test that batch validation reports the first failed rule."""
+        home_values = np.array([500000, 0, 500000, 300000, 500000, 500000, 500000])
+        deposits = np.array([100000, 50000, -10000, 300000, 100000, 100000, 100000])
+        interest_rates = np.array([5.5, 5.0, 5.0, 5.0, -1.0, 5.0, 5.0])
+        loan_terms = np.array([30, 30, 30, 30, 30, 0, 51])
+        
+        codes = validate_batch(home_values, deposits, interest_rates, loan_terms)
+        
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [0, 1, 2, 3, 4, 5, 6]
+        for i, code in enumerate(codes):
+            assert code == validate_inputs_code(
+                home_values[i], deposits[i], interest_rates[i], loan_terms[i]
+            )
+    
+    def test_validate_batch_scalar_and_empty(self, batch_backend):
+        """Test batch validation for 0-d and empty inputs."""
+        valid = validate_batch(500000, 100000, 5.5, 30)
+        invalid = validate_batch(500000, 100000, 5.5, 51)
+        empty = validate_batch(np.array([]), np.array([]), np.array([]), np.array([]))
+        
+        assert valid.shape == ()
+        assert int(valid) == 0
+        assert int(invalid) == 6
+        assert empty.shape == (0,)
+        assert empty.dtype == np.int8
 
 
 class TestPaymentSchedule:
     """Tests for PaymentSchedule data class."""
     
-    def test_to_dict_list(self):
-        """Test conversion to dictionary list."""
-        entries = [
-            PaymentScheduleEntry(
-                month=1,
-                payment=2000.0,
-                principal=500.0,
-                interest=1500.0,
-                remaining_balance=199500.0,
-                year=1,
-            )
+    def _single_payment_schedule(self):
+        """Build a schedule holding a single payment."""
+        return PaymentSchedule(
+            month=np.array([1]),
+            payment=np.array([2000.0]),
+            principal=np.array([500.0]),
+            interest=np.array([1500.0]),
+            remaining_balance=np.array([199500.0]),
+            year=np.array([1]),
+        )
+    
+    def test_to_dataframe(self):
+        """Test conversion to DataFrame."""
+        schedule = self._single_payment_schedule()
+        df = schedule.to_dataframe()
+        
+        assert len(df) == 1
+        assert list(df.columns) == [
+            "Month",
+            "Payment",
+            "Principal",
+            "Interest",
+            "Remaining Balance",
+            "Year",
+        ]
+        assert df["Month"].iloc[0] == 1
+        assert df["Payment"].iloc[0] == 2000.0
+        assert df["Principal"].iloc[0] == 500.0
+        assert df["Interest"].iloc[0] == 1500.0
+        assert df["Remaining Balance"].iloc[0] == 199500.0
+        assert df["Year"].iloc[0] == 1
+    
+    def test_entry_is_immutable_and_slotted(self):
+        """Test that schedule entries are frozen and have no __dict__."""
+        entry = self._single_payment_schedule()[0]
+        
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.payment = 0.0
+    
+    def test_to_columns(self):
+        """Test that columns are exposed without copying."""
+        schedule = self._single_payment_schedule()
+        columns = schedule.to_columns()
+        
+        assert list(columns) == [
+            "Month",
+            "Payment",
+            "Principal",
+            "Interest",
+            "Remaining Balance",
+            "Year",
         ]
-        schedule = PaymentSchedule(entries=entries)
-        dict_list = schedule.to_dict_list()
-        
-        assert len(dict_list) == 1
-        assert dict_list[0]["Month"] == 1
-        assert dict_list[0]["Payment"] == 2000.0
-        assert dict_list[0]["Principal"] == 500.0
-        assert dict_list[0]["Interest"] == 1500.0
-        assert dict_list[0]["Remaining Balance"] == 199500.0
-        assert dict_list[0]["Year"] == 1
+        assert columns["Payment"] is schedule.payment
+        assert columns["Remaining Balance"] is schedule.remaining_balance
+    
+    def test_to_dataframe_does_not_copy(self):
+        """Test that DataFrame columns share memory with the schedule."""
+        schedule = self._single_payment_schedule()
+        df = schedule.to_dataframe()
+        
+        assert np.shares_memory(df["Payment"].to_numpy(), schedule.payment)
+        assert np.shares_memory(
+            df["Remaining Balance"].to_numpy(), schedule.remaining_balance
+        )
+    
+    def test_getitem_materializes_entry(self):
+        """Test that indexing returns a PaymentScheduleEntry."""
+        schedule = self._single_payment_schedule()
+        
+        assert len(schedule) == 1
+        assert schedule[0] == PaymentScheduleEntry(
+            month=1,
+            payment=2000.0,
+            principal=500.0,
+            interest=1500.0,
+            remaining_balance=199500.0,
+            year=1,
+        )
+
+
+class TestScheduleFrames:
+    """Tests for the cached schedule table and chart data."""
+    
+    @pytest.mark.parametrize(
+        "loan_amount, expected_dtype",
+        [
+            (_FLOAT32_CHART_LIMIT - 1, np.float32),
+            (_FLOAT32_CHART_LIMIT, np.float64),
+            (_FLOAT32_CHART_LIMIT * 2, np.float64),
+        ],
+    )
+    def test_chart_data_dtype(self, loan_amount, expected_dtype):
+        """Test that chart data is float32 only below the limit."""
+        inputs = MortgageInputs(
+            home_value=float(loan_amount),
+            deposit=0,
+            interest_rate=5.5,
+            loan_term_years=30,
+        )
+        results, schedule = MortgageCalculator().calculate_all(inputs)
+        schedule_key = (
+            results.loan_amount,
+            results.monthly_interest_rate,
+            results.number_of_payments,
+            results.monthly_payment,
+        )
+        
+        # Call the undecorated function so Streamlit's cache is bypassed
+        df, payments_df = _build_schedule_frames.__wrapped__(schedule, schedule_key)
+        
+        assert payments_df["Remaining Balance"].dtype == expected_dtype
+        assert df["Remaining Balance"].dtype == np.float64
 
 
 if __name__ == "__main__":
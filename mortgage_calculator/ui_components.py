@@ -5,6 +5,7 @@ This module contains all Streamlit-specific UI code, separated from
 business logic for better testability and maintainability.
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 from typing import Tuple
@@ -27,9 +28,50 @@ from .utils import (
     create_schedule_dataframe,
     aggregate_by_year,
     calculate_loan_to_value_ratio,
+    SCHEDULE_COLUMN_FORMATS,
 )
 
 
+# Loans below this have their chart data sent as float32: under 2**23 the
+# float32 spacing is at most half a dollar, far finer than the chart shows
+_FLOAT32_CHART_LIMIT = 2**23
+
+
+@st.cache_data(max_entries=32)
+def _build_schedule_frames(
+    _schedule: PaymentSchedule,
+    schedule_key: Tuple[float, float, int, float],
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the schedule DataFrame and the yearly chart data.
+    
+    Cached across Streamlit reruns. The leading underscore keeps Streamlit
+    from hashing the schedule itself; ``schedule_key`` identifies it, and
+    its loan amount bounds the balances sent to the chart.
+    
+    Args:
+        _schedule: PaymentSchedule object
+        schedule_key: (loan amount, monthly rate, number of payments,
+            monthly payment) the schedule was generated from
+        
+    Returns:
+        Tuple of (schedule DataFrame, remaining balance by year)
+    """
+    loan_amount, _, _, _ = schedule_key
+    
+    # The chart data is reduced straight from the schedule arrays rather
+    # than from the DataFrame built for the table
+    payments_df = aggregate_by_year(_schedule)
+    
+    # The schedule itself stays float64; only the chart data is
+    # downcast, halving what is serialized to the frontend. No balance
+    # exceeds the loan amount, so it bounds the float32 rounding error
+    if loan_amount < _FLOAT32_CHART_LIMIT:
+        payments_df = payments_df.astype(np.float32)
+    
+    return create_schedule_dataframe(_schedule), payments_df
+
+
 class MortgageUI:
     """
     Streamlit UI components for mortgage calculator.
@@ -165,44 +207,46 @@ class MortgageUI:
                 )
     
     @staticmethod
-    def render_payment_schedule(schedule: PaymentSchedule) -> None:
+    def render_payment_schedule(
+        schedule: PaymentSchedule,
+        results: MortgageResults,
+    ) -> None:
         """
         Render the payment schedule section with chart and table.
         
         Args:
             schedule: PaymentSchedule object
+            results: MortgageResults object the schedule was generated from
         """
         st.write("### Payment Schedule")
         
-        # Create DataFrame from schedule
-        df = create_schedule_dataframe(schedule)
+        # The schedule is a pure function of these values, so they identify
+        # it for caching without hashing the schedule arrays themselves
+        schedule_key = (
+            results.loan_amount,
+            results.monthly_interest_rate,
+            results.number_of_payments,
+            results.monthly_payment,
+        )
+        df, payments_df = _build_schedule_frames(schedule, schedule_key)
         
         # Display line chart of remaining balance by year
-        payments_df = aggregate_by_year(df)
         st.line_chart(
             payments_df,
             use_container_width=True,
         )
         
-        # Display detailed schedule table in an expander
-        with st.expander("📋 View Detailed Payment Schedule"):
-            # Format currency columns for display
-            display_df = df.copy()
-            display_df["Payment"] = display_df["Payment"].apply(
-                lambda x: format_monthly_payment(x)
-            )
-            display_df["Principal"] = display_df["Principal"].apply(
-                lambda x: format_monthly_payment(x)
-            )
-            display_df["Interest"] = display_df["Interest"].apply(
-                lambda x: format_monthly_payment(x)
-            )
-            display_df["Remaining Balance"] = display_df["Remaining Balance"].apply(
-                lambda x: format_total_amount(x)
-            )
-            
+        # Display detailed schedule table only once the user asks for it;
+        # the body of a collapsed expander would still be rendered and
+        # formatted on every rerun
+        if st.toggle(
+            "📋 View Detailed Payment Schedule",
+            key="show_schedule_details",
+        ):
+            # Format currency columns at render time rather than copying
+            # the numeric DataFrame into string columns
             st.dataframe(
-                display_df,
+                df.style.format(SCHEDULE_COLUMN_FORMATS),
                 use_container_width=True,
                 hide_index=True,
             )
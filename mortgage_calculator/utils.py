@@ -5,15 +5,77 @@ This module contains helper functions for formatting, validation,
 and data conversion.
 """
 
+import functools
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
 import pandas as pd
-from typing import Optional
 
 from .config import (
     CURRENCY_SYMBOL,
     DECIMAL_PLACES_MONTHLY,
     DECIMAL_PLACES_TOTAL,
+    MAX_LOAN_TERM,
+    MIN_LOAN_TERM,
+)
+from .models import PaymentSchedule, _min_by_year
+
+# Format specs for the precisions used by the app, built once at import so
+# the common helpers don't re-interpret a dynamic precision on every call
+_CURRENCY_SPECS = {
+    DECIMAL_PLACES_MONTHLY: f",.{DECIMAL_PLACES_MONTHLY}f",
+    DECIMAL_PLACES_TOTAL: f",.{DECIMAL_PLACES_TOTAL}f",
+}
+
+# Pre-bound currency formatters for the two fixed precisions
+_FORMAT_MONTHLY = (
+    f"{CURRENCY_SYMBOL}{{:{_CURRENCY_SPECS[DECIMAL_PLACES_MONTHLY]}}}".format
+)
+_FORMAT_TOTAL = (
+    f"{CURRENCY_SYMBOL}{{:{_CURRENCY_SPECS[DECIMAL_PLACES_TOTAL]}}}".format
+)
+
+# Currency columns of a schedule DataFrame and their display precision
+_SCHEDULE_CURRENCY_COLUMNS = {
+    "Payment": DECIMAL_PLACES_MONTHLY,
+    "Principal": DECIMAL_PLACES_MONTHLY,
+    "Interest": DECIMAL_PLACES_MONTHLY,
+    "Remaining Balance": DECIMAL_PLACES_TOTAL,
+}
+
+# Styler display formats for the currency columns of a schedule table
+SCHEDULE_COLUMN_FORMATS: Dict[Any, Union[str, Callable[[object], str], None]] = {
+    name: f"{CURRENCY_SYMBOL}{{:{_CURRENCY_SPECS[decimal_places]}}}"
+    for name, decimal_places in _SCHEDULE_CURRENCY_COLUMNS.items()
+}
+
+# Validation error messages; validate_inputs_code result ``code`` is
+# described by VALIDATION_MESSAGES[code - 1]
+VALIDATION_MESSAGES: Tuple[str, ...] = (
+    "Home value must be greater than zero.",
+    "Deposit cannot be negative.",
+    "Deposit must be less than home value.",
+    "Interest rate cannot be negative.",
+    "Loan term must be at least 1 year.",
+    f"Loan term cannot exceed {MAX_LOAN_TERM} years.",
 )
-from .models import PaymentSchedule
+
+# Result of aggregate_by_year for an empty schedule
+_EMPTY_YEARLY_BALANCE = pd.DataFrame(columns=["Year", "Remaining Balance"])
+
+
+def _currency_spec(decimal_places: int) -> str:
+    """
+    Return the number format spec for a currency precision.
+    
+    Args:
+        decimal_places: Number of decimal places to display
+        
+    Returns:
+        Format spec such as ",.2f", prebuilt for the app's precisions
+    """
+    return _CURRENCY_SPECS.get(decimal_places) or f",.{decimal_places}f"
 
 
 def format_currency(
@@ -36,7 +98,33 @@ def format_currency(
         >>> format_currency(1234.56, 2)
         '$1,234.56'
     """
-    return f"{symbol}{amount:,.{decimal_places}f}"
+    return symbol + format(amount, _currency_spec(decimal_places))
+
+
+def format_currency_series(
+    amounts: pd.Series,
+    decimal_places: int = DECIMAL_PLACES_TOTAL,
+    symbol: str = CURRENCY_SYMBOL,
+) -> pd.Series:
+    """
+    Format a whole column of numbers as currency.
+    
+    Equivalent to calling format_currency on every element, but the
+    format string is built once for the column instead of per value.
+    
+    Args:
+        amounts: The amounts to format
+        decimal_places: Number of decimal places to display
+        symbol: Currency symbol to use
+        
+    Returns:
+        Series of formatted currency strings with the same index
+        
+    Example:
+        >>> format_currency_series(pd.Series([1234.56, 99.5]), 2).tolist()
+        ['$1,234.56', '$99.50']
+    """
+    return amounts.map(f"{symbol}{{:{_currency_spec(decimal_places)}}}".format)
 
 
 def format_monthly_payment(amount: float) -> str:
@@ -49,7 +137,7 @@ def format_monthly_payment(amount: float) -> str:
     Returns:
         Formatted currency string with 2 decimal places
     """
-    return format_currency(amount, DECIMAL_PLACES_MONTHLY)
+    return _FORMAT_MONTHLY(amount)
 
 
 def format_total_amount(amount: float) -> str:
@@ -62,36 +150,147 @@ def format_total_amount(amount: float) -> str:
     Returns:
         Formatted currency string with no decimal places
     """
-    return format_currency(amount, DECIMAL_PLACES_TOTAL)
+    # round() uses the same round-half-even rule as the ",.0f" float spec,
+    # and int grouping skips the float formatter entirely
+    try:
+        return f"{CURRENCY_SYMBOL}{round(amount):,}"
+    except (ValueError, OverflowError):
+        # NaN and infinity have no integer value
+        return _FORMAT_TOTAL(amount)
 
 
-def create_schedule_dataframe(schedule: PaymentSchedule) -> pd.DataFrame:
+def create_schedule_dataframe(
+    schedule: PaymentSchedule,
+    formatted: bool = False,
+) -> pd.DataFrame:
     """
     Convert PaymentSchedule to pandas DataFrame.
     
     Args:
         schedule: PaymentSchedule object
+        formatted: Whether to render the currency columns as strings
+            (payments with 2 decimal places, balance with none)
         
     Returns:
         DataFrame with payment schedule data
     """
-    return pd.DataFrame(schedule.to_dict_list())
+    if not formatted:
+        return schedule.to_dataframe()
+    
+    # Format each currency column straight from the schedule arrays while
+    # building the frame, rather than building it and formatting after
+    columns: Dict[str, Union[np.ndarray, pd.Series]] = {}
+    for name, values in schedule.to_columns().items():
+        decimal_places = _SCHEDULE_CURRENCY_COLUMNS.get(name)
+        if decimal_places is None:
+            columns[name] = values
+        else:
+            columns[name] = format_currency_series(
+                pd.Series(values, copy=False), decimal_places
+            )
+    return pd.DataFrame(columns)
 
 
-def aggregate_by_year(df: pd.DataFrame) -> pd.DataFrame:
+def aggregate_by_year(
+    data: Union[pd.DataFrame, PaymentSchedule],
+) -> pd.DataFrame:
     """
     Aggregate payment schedule by year, showing minimum remaining balance.
     
+    Rows sorted by Year, as in every generated schedule, are reduced in
+    one vectorized pass over each year's run; any other DataFrame falls
+    back to a pandas groupby.
+    
     Args:
-        df: DataFrame with payment schedule
+        data: PaymentSchedule object, or DataFrame with payment schedule
         
     Returns:
         DataFrame grouped by year with minimum remaining balance
     """
-    if df.empty:
-        return pd.DataFrame(columns=["Year", "Remaining Balance"])
+    if isinstance(data, PaymentSchedule):
+        if len(data) == 0:
+            return _EMPTY_YEARLY_BALANCE.copy()
+        years, min_balances = data.min_balance_by_year()
+    else:
+        # len() of the index skips the DataFrame.empty property chain
+        if len(data.index) == 0:
+            # Copying the prebuilt frame is much cheaper than constructing one
+            return _EMPTY_YEARLY_BALANCE.copy()
+        years = data["Year"].to_numpy()
+        if not np.all(np.diff(years) >= 0):
+            return data.groupby("Year")[["Remaining Balance"]].min()
+        years, min_balances = _min_by_year(
+            years, data["Remaining Balance"].to_numpy()
+        )
     
-    return df[["Year", "Remaining Balance"]].groupby("Year").min()
+    return pd.DataFrame(
+        {"Remaining Balance": min_balances},
+        index=pd.Index(years, name="Year"),
+    )
+
+
+def _failed_validation_rules(
+    home_value: Any,
+    deposit: Any,
+    interest_rate: Any,
+    loan_term: Any,
+) -> Tuple[Any, ...]:
+    """
+    Evaluate every validation rule, in VALIDATION_MESSAGES order.
+    
+    Works on scalars and on broadcastable NumPy arrays alike, so the
+    scalar and batch validators share a single definition of the rules.
+    
+    Args:
+        home_value: The home value(s)
+        deposit: The deposit amount(s)
+        interest_rate: Annual interest rate percentage(s)
+        loan_term: Loan term(s) in years
+        
+    Returns:
+        Tuple holding, for each rule, whether it failed
+    """
+    return (
+        home_value <= 0,
+        deposit < 0,
+        deposit >= home_value,
+        interest_rate < 0,
+        loan_term < MIN_LOAN_TERM,
+        loan_term > MAX_LOAN_TERM,
+    )
+
+
+def validate_inputs_code(
+    home_value: float,
+    deposit: float,
+    interest_rate: float,
+    loan_term: int,
+) -> int:
+    """
+    Validate mortgage input values, returning a numeric result code.
+    
+    Cheaper than validate_inputs on hot paths that only need to know
+    whether the inputs are valid; a nonzero code's message is
+    VALIDATION_MESSAGES[code - 1].
+    
+    Args:
+        home_value: The home value
+        deposit: The deposit amount
+        interest_rate: Annual interest rate percentage
+        loan_term: Loan term in years
+        
+    Returns:
+        0 if the inputs are valid, otherwise the 1-based position of the
+        first failed rule in VALIDATION_MESSAGES
+    """
+    failed = _failed_validation_rules(home_value, deposit, interest_rate, loan_term)
+    
+    # Valid inputs return after a single check; the failed rule is only
+    # looked up once something has failed
+    if not any(failed):
+        return 0
+    
+    return failed.index(True) + 1
 
 
 def validate_inputs(
@@ -112,25 +311,10 @@ def validate_inputs(
     Returns:
         Error message if validation fails, None otherwise
     """
-    if home_value <= 0:
-        return "Home value must be greater than zero."
-    
-    if deposit < 0:
-        return "Deposit cannot be negative."
-    
-    if deposit >= home_value:
-        return "Deposit must be less than home value."
-    
-    if interest_rate < 0:
-        return "Interest rate cannot be negative."
-    
-    if loan_term < 1:
-        return "Loan term must be at least 1 year."
-    
-    if loan_term > 50:
-        return "Loan term cannot exceed 50 years."
-    
-    return None
+    code = validate_inputs_code(home_value, deposit, interest_rate, loan_term)
+    if code == 0:
+        return None
+    return VALIDATION_MESSAGES[code - 1]
 
 
 def calculate_loan_to_value_ratio(home_value: float, deposit: float) -> float:
@@ -149,3 +333,121 @@ def calculate_loan_to_value_ratio(home_value: float, deposit: float) -> float:
     
     loan_amount = home_value - deposit
     return (loan_amount / home_value) * 100
+
+
+@functools.lru_cache(maxsize=None)
+def _load_numba_kernels() -> Optional[ModuleType]:
+    """
+    Import the Numba batch kernels on first use.
+    
+    Returns:
+        The _numba_kernels module, or None if Numba is not installed
+    """
+    try:
+        from . import _numba_kernels
+    except ImportError:
+        return None
+    
+    return _numba_kernels
+
+
+def loan_to_value_ratio_cfunc() -> Any:
+    """
+    Return a native C-callable version of calculate_loan_to_value_ratio.
+    
+    Intended for tight numeric loops (e.g. solvers over LTV constraints)
+    that would otherwise pay Python call overhead per evaluation. The
+    returned Numba ``CFunc`` can be called directly from ``@njit`` code,
+    and exposes ``.address`` and ``.ctypes`` for other FFI callers.
+    
+    Returns:
+        Numba CFunc with signature ``float64(float64, float64)``
+        
+    Raises:
+        ImportError: If Numba is not installed
+    """
+    kernels = _load_numba_kernels()
+    if kernels is None:
+        raise ImportError("loan_to_value_ratio_cfunc requires Numba")
+    
+    return kernels.ltv_cfunc
+
+
+def ltv_batch(home_values: np.ndarray, deposits: np.ndarray) -> np.ndarray:
+    """
+    Calculate loan-to-value ratios for many scenarios at once.
+    
+    Uses a parallel Numba kernel when Numba is installed and an
+    equivalent vectorized NumPy expression otherwise.
+    
+    Args:
+        home_values: Home values
+        deposits: Deposit amounts, broadcast against home_values
+        
+    Returns:
+        Array of LTV ratios as percentages, shaped like the broadcast inputs
+    """
+    home_values, deposits = np.broadcast_arrays(
+        np.asarray(home_values, dtype=np.float64),
+        np.asarray(deposits, dtype=np.float64),
+    )
+    
+    kernels = _load_numba_kernels()
+    if kernels is not None:
+        return kernels.ltv_batch(home_values.ravel(), deposits.ravel()).reshape(
+            home_values.shape
+        )
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            home_values <= 0,
+            0.0,
+            (home_values - deposits) / home_values * 100,
+        )
+
+
+def validate_batch(
+    home_values: np.ndarray,
+    deposits: np.ndarray,
+    interest_rates: np.ndarray,
+    loan_terms: np.ndarray,
+) -> np.ndarray:
+    """
+    Validate many sets of mortgage inputs at once.
+    
+    Applies the same rules as validate_inputs_code, in the same order. Uses a
+    parallel Numba kernel when Numba is installed and vectorized NumPy
+    otherwise.
+    
+    Args:
+        home_values: Home values
+        deposits: Deposit amounts
+        interest_rates: Annual interest rate percentages
+        loan_terms: Loan terms in years
+        
+    Returns:
+        int8 array of validate_inputs_code results shaped like the
+        broadcast inputs
+    """
+    home_values, deposits, interest_rates, loan_terms = np.broadcast_arrays(
+        np.asarray(home_values, dtype=np.float64),
+        np.asarray(deposits, dtype=np.float64),
+        np.asarray(interest_rates, dtype=np.float64),
+        np.asarray(loan_terms, dtype=np.int64),
+    )
+    
+    kernels = _load_numba_kernels()
+    if kernels is not None:
+        return kernels.validate_batch(
+            home_values.ravel(),
+            deposits.ravel(),
+            interest_rates.ravel(),
+            loan_terms.ravel(),
+        ).reshape(home_values.shape)
+    
+    # np.select picks the first matching rule, like validate_inputs_code
+    return np.select(
+        _failed_validation_rules(home_values, deposits, interest_rates, loan_terms),
+        range(1, len(VALIDATION_MESSAGES) + 1),
+        default=0,
+    ).astype(np.int8)
@@ -33,9 +33,10 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.8",
-    install_requires=requirements[:3],  # Only core dependencies
+    install_requires=requirements[:4],  # Only core dependencies
     extras_require={
-        "dev": requirements[3:],  # Development dependencies
+        "dev": requirements[4:],  # Development dependencies
+        "numba": ["numba>=0.57.0"],  # JIT-compiled schedule kernel
     },
     entry_points={
         "console_scripts": [